@@ -1,42 +1,43 @@
 from commonroad.scenario.scenario import Scenario
 
+_FRAME_FACTORS_SIM = {
+    "DEU_MONAEast": 0.86,
+    "DEU_MONAMerge": 0.80,
+    "DEU_MONAWest": 0.96,
+    "DEU_AachenBendplatz": 0.85,
+    "DEU_AachenHeckstrasse": 0.90,
+    "DEU_LocationCLower4": 0.94,
+}
+
+_FRAME_FACTORS_ORIG = {
+    "DEU_MONAEast": 0.75,
+    "DEU_MONAMerge": 0.6,
+    "DEU_MONAWest": 0.9,
+    "DEU_AachenBendplatz": 0.7,
+    "DEU_AachenHeckstrasse": 0.78,
+    "DEU_LocationCLower4": 0.87,
+}
+
+
+def _get_location_name(scenario: Scenario) -> str:
+    """
+    Get the location part (e.g. DEU_MONAEast) of the scenario ID, without formatting and splitting the full ID.
+    """
+    return f"{scenario.scenario_id.country_id}_{scenario.scenario_id.map_name}"
+
 
 def get_frame_factor_sim(scenario: Scenario) -> float:
     """
     Use this to calculate the frame factor for simulations run with `SimulationMode.RESIMULATION` and `SimulationMode.DELAY`.
     """
-    scenario_id = str(scenario.scenario_id).split("-")[-3]
-    match scenario_id:
-        case "DEU_MONAEast":
-            return 0.86
-        case "DEU_MONAMerge":
-            return 0.80
-        case "DEU_MONAWest":
-            return 0.96
-        case "DEU_AachenBendplatz":
-            return 0.85
-        case "DEU_AachenHeckstrasse":
-            return 0.90
-        case "DEU_LocationCLower4":
-            return 0.94
-        case _:
-            raise ValueError(f"No frame factor defined for scenario {scenario.scenario_id}")
+    frame_factor = _FRAME_FACTORS_SIM.get(_get_location_name(scenario))
+    if frame_factor is None:
+        raise ValueError(f"No frame factor defined for scenario {scenario.scenario_id}")
+    return frame_factor
 
 
 def get_frame_factor_orig(scenario: Scenario) -> float:
-    scenario_id = str(scenario.scenario_id).split("-")[-3]
-    match scenario_id:
-        case "DEU_MONAEast":
-            return 0.75
-        case "DEU_MONAMerge":
-            return 0.6
-        case "DEU_MONAWest":
-            return 0.9
-        case "DEU_AachenBendplatz":
-            return 0.7
-        case "DEU_AachenHeckstrasse":
-            return 0.78
-        case "DEU_LocationCLower4":
-            return 0.87
-        case _:
-            raise ValueError(f"No frame factor defined for scenario {scenario.scenario_id}")
+    frame_factor = _FRAME_FACTORS_ORIG.get(_get_location_name(scenario))
+    if frame_factor is None:
+        raise ValueError(f"No frame factor defined for scenario {scenario.scenario_id}")
+    return frame_factor
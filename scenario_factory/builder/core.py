@@ -95,17 +95,11 @@ def intersect_lines(line1: np.ndarray, line2: np.ndarray) -> Tuple:
     return (x_intersection, y_intersection)
 
 
-def euclidean_distance(p: Tuple[float, float], q):
-    return np.sqrt(np.square(p[0] - q[0]) + np.square(p[1] - q[1]))
-
-
 def nearest_point(
     reference_point: Tuple[float, float], points: np.ndarray[float, np.dtype]
 ) -> np.ndarray[float, np.dtype]:
-    index = np.argsort(np.array([euclidean_distance(reference_point, point) for point in points]))[
-        0
-    ]
-    return points[index]
+    distances = np.hypot(points[:, 0] - reference_point[0], points[:, 1] - reference_point[1])
+    return points[np.argmin(distances)]
 
 
 def create_curve(
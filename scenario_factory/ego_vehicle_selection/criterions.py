@@ -110,7 +110,9 @@ class AccelerationCriterion(EgoVehicleSelectionCriterion):
         time_step = matching_state.time_step
 
         _LOGGER.debug(
-            f"AccelerationCriterion matched obstacle {obstacle.obstacle_id} at time step {time_step}"
+            "AccelerationCriterion matched obstacle %s at time step %s",
+            obstacle.obstacle_id,
+            time_step,
         )
 
         return True, time_step
@@ -164,7 +166,7 @@ class BrakingCriterion(EgoVehicleSelectionCriterion):
         time_step = matching_state.time_step
 
         _LOGGER.debug(
-            f"BrakingCriterion matched obstacle {obstacle.obstacle_id} at time step {time_step}"
+            "BrakingCriterion matched obstacle %s at time step %s", obstacle.obstacle_id, time_step
         )
 
         return True, time_step
@@ -217,7 +219,7 @@ class TurningCriterion(EgoVehicleSelectionCriterion):
         time_step = matched_state.time_step
 
         _LOGGER.debug(
-            f"TurningCriterion matched obstacle {obstacle.obstacle_id} at time step {time_step}"
+            "TurningCriterion matched obstacle %s at time step %s", obstacle.obstacle_id, time_step
         )
 
         return True, time_step
@@ -308,7 +310,9 @@ class LaneChangeCriterion(EgoVehicleSelectionCriterion):
             return False, -1
 
         _LOGGER.debug(
-            f"LaneChangeCriterion matched obstacle {obstacle.obstacle_id} at time step {time_step}"
+            "LaneChangeCriterion matched obstacle %s at time step %s",
+            obstacle.obstacle_id,
+            time_step,
         )
 
         return True, time_step
@@ -49,7 +49,10 @@ def _does_ego_vehicle_maneuver_reach_minimum_velocity(
     if not any(state.velocity >= min_ego_velocity for state in state_list):
         v_max = max([state.velocity for state in state_list])
         _LOGGER.debug(
-            f"Maneuver {maneuver} is not interesting as ego vehicle: maximum velocity {v_max} m/s does not exceed required {min_ego_velocity} m/s!"
+            "Maneuver %s is not interesting as ego vehicle: maximum velocity %s m/s does not exceed required %s m/s!",
+            maneuver,
+            v_max,
+            min_ego_velocity,
         )
         return False
 
@@ -75,7 +78,7 @@ def _does_ego_vehicle_maneuver_last_long_enough(
         < scenario_time_steps
     ):
         _LOGGER.debug(
-            f"Maneuver {maneuver} is not interesting as ego vehicle: Time horizon too short"
+            "Maneuver %s is not interesting as ego vehicle: Time horizon too short", maneuver
         )
         return False
 
@@ -83,7 +86,10 @@ def _does_ego_vehicle_maneuver_last_long_enough(
     if trajectory_length < scenario_time_steps:
         # TODO: trajectory_length is sometimes negative. How is this possible?
         _LOGGER.debug(
-            f"Maneuver {maneuver} is not interesting as ego vehicle: Trajectory too short: must be at least {scenario_time_steps} but is only {trajectory_length}"
+            "Maneuver %s is not interesting as ego vehicle: Trajectory too short: must be at least %s but is only %s",
+            maneuver,
+            scenario_time_steps,
+            trajectory_length,
         )
         return False
 
@@ -126,7 +132,8 @@ def _does_ego_vehicle_maneuver_happen_on_interesting_lanelet_network(
 
     if len(final_lanelet_ids) == 0 or len(init_lanelet_ids) == 0:
         _LOGGER.debug(
-            f"Maneuver {maneuver} not interesting as ego vehicle: Maneuver does not happen on the map"
+            "Maneuver %s not interesting as ego vehicle: Maneuver does not happen on the map",
+            maneuver,
         )
         return False
 
@@ -186,7 +193,10 @@ def _does_ego_vehicle_maneuver_have_enough_surrounding_vehicles_on_adjacent_lane
 
     if num_veh < min_vehicles_in_range:
         _LOGGER.debug(
-            f"Maneuver {maneuver} not interesting as ego vehicle: Not enough other vehicles found around possible ego vehicle (found {num_veh}; minimum {min_vehicles_in_range})"
+            "Maneuver %s not interesting as ego vehicle: Not enough other vehicles found around possible ego vehicle (found %s; minimum %s)",
+            maneuver,
+            num_veh,
+            min_vehicles_in_range,
         )
         return False
     return True
@@ -262,9 +272,10 @@ class InterestingLaneletNetworkFilter(EgoVehicleManeuverFilter):
         if is_interesting:
             return True
 
-        if random.uniform(0, 1) < self._random_inclusion_probability:
+        if random.random() < self._random_inclusion_probability:
             _LOGGER.debug(
-                f"Randomly included maneuver {ego_vehicle_maneuver}, although it does not have any interesting lanelet features"
+                "Randomly included maneuver %s, although it does not have any interesting lanelet features",
+                ego_vehicle_maneuver,
             )
             return True
 
@@ -41,7 +41,10 @@ def find_ego_vehicle_maneuvers_in_scenario(
                 absolute_init_time, scenario.dt
             )
             _LOGGER.debug(
-                f"Adjusted maneuver start time {absolute_init_time} of obstacle {obstacle.obstacle_id} to {adjusted_absolute_init_time}"
+                "Adjusted maneuver start time %s of obstacle %s to %s",
+                absolute_init_time,
+                obstacle.obstacle_id,
+                adjusted_absolute_init_time,
             )
 
             selected_maneuvers.append(EgoVehicleManeuver(obstacle, adjusted_absolute_init_time))
@@ -1,13 +1,14 @@
 import logging
-from collections import defaultdict
+from dataclasses import dataclass
 from typing import Dict, List, Sequence, Tuple
 
 import numpy as np
 from commonroad.geometry.shape import Circle
 from commonroad.scenario.lanelet import Lanelet, LaneletNetwork
 from commonroad.scenario.scenario import Scenario
-from scipy.spatial import distance
-from sklearn.cluster import AgglomerativeClustering
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
 from scenario_factory.globetrotter.region import Coordinates, RegionMetadata
 from scenario_factory.utils import copy_scenario
@@ -15,27 +16,39 @@ from scenario_factory.utils import copy_scenario
 _LOGGER = logging.getLogger(__name__)
 
 
-def find_clusters_agglomerative(points: np.ndarray) -> AgglomerativeClustering:
+@dataclass
+class AgglomerativeClusteringResult:
+    """
+    Result of :func:`find_clusters_agglomerative`. The `labels_` attribute follows the naming of scikit-learn's clustering estimators.
+    """
+
+    labels_: np.ndarray
+
+
+def find_clusters_agglomerative(points: np.ndarray) -> AgglomerativeClusteringResult:
     """
     Find intersections using agglomerative clustering
 
     :param points: forking points used for the clustering process
-    :return: Cluster with labeled forking points
+    :return: Cluster with labeled forking points. The clusters are labeled in the order in which they first occur in `points`.
     """
-    metric = "euclidean"
-    linkage = "single"
     distance_treshold = 35
-
-    # cluster using SciKit's Agglomerative Clustering implementation
-    cluster = AgglomerativeClustering(
-        metric=metric,
-        linkage=linkage,
-        distance_threshold=distance_treshold,
-        n_clusters=None,
+    points = np.asarray(points)
+
+    # Single linkage clusters at a fixed distance threshold are exactly the connected components
+    # of the graph, that connects all points which are closer than the threshold. Using a kd-tree
+    # only the close pairs must be found, instead of computing all pairwise distances.
+    # Clusters must be strictly closer than the threshold to be merged, while query_pairs
+    # also returns pairs whose distance is equal to the threshold.
+    pairs = cKDTree(points).query_pairs(np.nextafter(distance_treshold, 0), output_type="ndarray")
+    adjacency_matrix = coo_matrix(
+        (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+        shape=(len(points), len(points)),
     )
-    cluster.fit_predict(points)
+    # The components are labeled in the order in which they are first reached, when iterating over the points
+    _, labels = connected_components(adjacency_matrix, directed=False)
 
-    return cluster
+    return AgglomerativeClusteringResult(labels)
 
 
 def get_distance_to_outer_point(center: np.ndarray, cluster: Sequence[np.ndarray]) -> float:
@@ -52,17 +65,16 @@ def get_distance_to_outer_point(center: np.ndarray, cluster: Sequence[np.ndarray
     if len(cluster) == 1:
         return 50
 
-    max_dis = 0
-    for p in cluster:
-        dist = distance.euclidean(center, p)
-        max_dis = max(dist, max_dis)
+    if len(cluster) == 0:
+        return 0
 
-    return max_dis
+    distances = np.linalg.norm(np.asarray(cluster, dtype=np.float64) - center, axis=1)
+    return float(distances.max())
 
 
 def centroids_and_distances(
     labels: np.ndarray, points: np.ndarray
-) -> Tuple[Dict[float, np.ndarray], Dict[float, float], Dict[float, List[np.ndarray]]]:
+) -> Tuple[Dict[int, np.ndarray], Dict[int, float], Dict[int, np.ndarray]]:
     """
     Create dictionaries with points assigned to each cluster, the clusters' centers and max distances in each cluster
 
@@ -71,19 +83,43 @@ def centroids_and_distances(
     :return: center, max_distance and cluster dictionaries
     """
 
-    clusters = defaultdict(list)
-    centroids = dict()
-    distances = dict()
+    points = np.asarray(points)
+    labels = np.asarray(labels)
+
+    # check for noise from DBSCAN
+    is_clustered = labels != -1
+    clustered_points = points[is_clustered]
+    cluster_labels, first_occurence_indices, cluster_indices, cluster_sizes = np.unique(
+        labels[is_clustered], return_index=True, return_inverse=True, return_counts=True
+    )
+
+    # compute the centers of all clusters by grouping the points by their cluster
+    centroid_array = (
+        np.stack(
+            [
+                np.bincount(cluster_indices, weights=clustered_points[:, 0]),
+                np.bincount(cluster_indices, weights=clustered_points[:, 1]),
+            ],
+            axis=1,
+        )
+        / cluster_sizes[:, np.newaxis]
+    )
 
-    for point, cluster_n in zip(points, labels):
-        # check for noise from DBSCAN
-        if cluster_n != -1:
-            clusters[cluster_n].append(tuple(point))
+    grouped_points = np.split(
+        clustered_points[np.argsort(cluster_indices, kind="stable")], np.cumsum(cluster_sizes)[:-1]
+    )
 
-    # compute center and distances
-    for key in clusters:
-        centroids[key] = np.mean(clusters[key], axis=0)
-        distances[key] = get_distance_to_outer_point(centroids[key], clusters[key])
+    centroids: Dict[int, np.ndarray] = dict()
+    distances: Dict[int, float] = dict()
+    clusters: Dict[int, np.ndarray] = dict()
+    # The clusters are inserted in the order of their first occurence, so that the order of the resulting intersections is stable
+    for cluster_index in np.argsort(first_occurence_indices):
+        key = int(cluster_labels[cluster_index])
+        centroids[key] = centroid_array[cluster_index]
+        distances[key] = get_distance_to_outer_point(
+            centroid_array[cluster_index], grouped_points[cluster_index]
+        )
+        clusters[key] = grouped_points[cluster_index]
 
     return centroids, distances, clusters
 
@@ -130,8 +166,9 @@ def cut_intersection_from_scenario(
     cut_shape = Circle(radius, center)
 
     # TODO: Cut static obstacles in circle and include in new scenario
+    # The references are cleaned up explicitly below, so the lanelet network does not need to clean them up as well
     cut_lanelet_network = LaneletNetwork.create_from_lanelet_network(
-        scenario.lanelet_network, cut_shape
+        scenario.lanelet_network, cut_shape, cleanup_ids=False
     )
 
     cut_lanelet_network.cleanup_lanelet_references()
@@ -168,17 +205,37 @@ def extract_forking_points(lanelets: Sequence[Lanelet]) -> np.ndarray:
     """
     Extract the start/end point of a lanelet that has more than one predessor/successor
     """
-    forking_set = set()
-
-    lanelet_ids = [lanelet.lanelet_id for lanelet in lanelets]
-
-    for lanelet in lanelets:
-        if len(lanelet.predecessor) > 1 and set(lanelet.predecessor).issubset(lanelet_ids):
-            forking_set.add((lanelet.center_vertices[0][0], lanelet.center_vertices[0][1]))
-        if len(lanelet.successor) > 1 and set(lanelet.successor).issubset(lanelet_ids):
-            forking_set.add((lanelet.center_vertices[-1][0], lanelet.center_vertices[-1][1]))
+    if len(lanelets) == 0:
+        return np.array([])
+
+    # Use a set, so that the membership checks below are constant time
+    lanelet_ids = {lanelet.lanelet_id for lanelet in lanelets}
+
+    # Gather the start and end points of all lanelets once, and select the forking points with masks
+    start_points = np.asarray([lanelet.center_vertices[0] for lanelet in lanelets])
+    end_points = np.asarray([lanelet.center_vertices[-1] for lanelet in lanelets])
+    has_forking_predecessors = np.array(
+        [
+            len(lanelet.predecessor) > 1
+            and all(predecessor in lanelet_ids for predecessor in lanelet.predecessor)
+            for lanelet in lanelets
+        ],
+        dtype=bool,
+    )
+    has_forking_successors = np.array(
+        [
+            len(lanelet.successor) > 1
+            and all(successor in lanelet_ids for successor in lanelet.successor)
+            for lanelet in lanelets
+        ],
+        dtype=bool,
+    )
 
-    forking_points = np.array(list(forking_set))
+    # Multiple lanelets can share the same forking point, so duplicates must be removed
+    forking_points = np.unique(
+        np.vstack([start_points[has_forking_predecessors], end_points[has_forking_successors]]),
+        axis=0,
+    )
     return forking_points
 
 
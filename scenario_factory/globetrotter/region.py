@@ -13,7 +13,6 @@ from pathlib import Path
 from typing import Iterator, Optional, Tuple
 
 import iso3166
-import numpy as np
 import pyproj
 from commonroad.scenario.scenario import GeoTransformation, Location, ScenarioID
 from crdesigner.map_conversion.osm2cr.converter_modules.utility.geonamesID import (
@@ -35,7 +34,7 @@ def _get_geonames_tree():
         return create_tree_from_file()
 
 
-@dataclass
+@dataclass(slots=True)
 class Coordinates:
     """
     Common representation of latitude and longitude coordinates, that provides utilities for parsing and serialization.
@@ -93,7 +92,7 @@ class Coordinates:
         return f"{self.lat}/{self.lon}"
 
 
-@dataclass
+@dataclass(slots=True)
 class RegionMetadata:
     """
     Hold metadata about a region anywhere on the world. Usefull when more information about a region then just coordinates is needed.
@@ -168,15 +167,16 @@ def _compute_bounding_box_coordinates(
     """
 
     dist_degree = radius / RADIUS_EARTH * 180 / math.pi
-    west = lon - dist_degree / np.cos(np.deg2rad(lat))
+    dist_degree_lon = dist_degree / math.cos(math.radians(lat))
+    west = lon - dist_degree_lon
     south = lat - dist_degree
-    east = lon + dist_degree / np.cos(np.deg2rad(lat))
+    east = lon + dist_degree_lon
     north = lat + dist_degree
 
     return west, south, east, north
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     west: float
     south: float
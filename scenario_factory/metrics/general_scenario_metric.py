@@ -1,12 +1,10 @@
 import csv
-from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Sequence, Tuple
 
 import numpy as np
 from commonroad.prediction.prediction import TrajectoryPrediction
-from commonroad.scenario.lanelet import Lanelet
 from commonroad.scenario.scenario import Scenario
 
 from scenario_factory.metrics.base import BaseMetric, combine_metrics
@@ -46,34 +44,7 @@ def write_general_scenario_metrics_to_csv(
     :returns: Nothing.
     """
 
-    formatted_data = []
-    for general_scenario_metric in combine_metrics(general_scenario_metric_collection):
-        formatted_data.append(
-            [
-                str(general_scenario_metric.scenario_id),
-                round(
-                    general_scenario_metric.frequency, _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION
-                ),
-                round(
-                    general_scenario_metric.traffic_density_mean,
-                    _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
-                ),
-                round(
-                    general_scenario_metric.traffic_density_stdev,
-                    _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
-                ),
-                round(
-                    general_scenario_metric.velocity_mean,
-                    _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
-                ),
-                round(
-                    general_scenario_metric.velocity_stdev,
-                    _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
-                ),
-            ]
-        )
-
-    with open(csv_file_path, "w") as csv_file:
+    with open(csv_file_path, "w", newline="") as csv_file:
         csv_writer = csv.writer(csv_file)
         csv_writer.writerow(
             [
@@ -85,7 +56,32 @@ def write_general_scenario_metrics_to_csv(
                 "v stdev [m/s]",
             ]
         )
-        csv_writer.writerows(formatted_data)
+        for general_scenario_metric in combine_metrics(general_scenario_metric_collection):
+            csv_writer.writerow(
+                [
+                    str(general_scenario_metric.scenario_id),
+                    round(
+                        general_scenario_metric.frequency,
+                        _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
+                    ),
+                    round(
+                        general_scenario_metric.traffic_density_mean,
+                        _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
+                    ),
+                    round(
+                        general_scenario_metric.traffic_density_stdev,
+                        _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
+                    ),
+                    round(
+                        general_scenario_metric.velocity_mean,
+                        _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
+                    ),
+                    round(
+                        general_scenario_metric.velocity_stdev,
+                        _DEFAULT_GENERAL_SCENARIO_METRIC_PRECISION,
+                    ),
+                ]
+            )
 
 
 def compute_general_scenario_metric(
@@ -121,7 +117,7 @@ def _compute_spawn_frequency(scenario: Scenario) -> float:
 
     # number of vehicles with initial time > 0
     number_of_spawned_vehicles = sum(
-        [1 for obs in scenario.dynamic_obstacles if obs.initial_state.time_step > min_time_step]
+        1 for obs in scenario.dynamic_obstacles if obs.initial_state.time_step > min_time_step
     )
     if number_of_spawned_vehicles == 0:
         return 0.0
@@ -135,16 +131,25 @@ def _compute_spawn_frequency(scenario: Scenario) -> float:
 
 def _compute_velocity(scenario: Scenario) -> Tuple[float, float]:
     # calculate mean velocity
-    velocities_at_k = defaultdict(list)
-
-    for obs in scenario.dynamic_obstacles:
-        if not isinstance(obs.prediction, TrajectoryPrediction):
-            continue
-        for state in obs.prediction.trajectory.state_list:
-            velocities_at_k[state.time_step].append(state.velocity)
+    states = [
+        state
+        for obs in scenario.dynamic_obstacles
+        if isinstance(obs.prediction, TrajectoryPrediction)
+        for state in obs.prediction.trajectory.state_list
+    ]
+    time_steps = np.fromiter(
+        (state.time_step for state in states), dtype=np.int64, count=len(states)
+    )
+    velocities = np.fromiter(
+        (state.velocity for state in states), dtype=np.float64, count=len(states)
+    )
 
-    mean_velocity_over_time = np.array(
-        [v for v in {k: sum(v) / len(v) for k, v in velocities_at_k.items()}.values()]
+    # Group the velocities by their time step, to compute the mean velocity at each time step
+    number_of_states_at_k = np.bincount(time_steps)
+    has_states_at_k = number_of_states_at_k > 0
+    mean_velocity_over_time = (
+        np.bincount(time_steps, weights=velocities)[has_states_at_k]
+        / number_of_states_at_k[has_states_at_k]
     )
 
     return np.mean(mean_velocity_over_time), np.std(mean_velocity_over_time)
@@ -156,19 +161,31 @@ def _compute_traffic_density(scenario: Scenario, frame_factor: float) -> Tuple[f
     if max_time_step == 0:
         return float("nan"), float("nan")
 
-    number_of_vehicles_at_time_step: List[int] = [0] * max_time_step
-    # By iterating over the time steps instead of the obstacle trajectories, no checks
-    # on the trajectories have to be performed here.
-    for time_step in range(max_time_step):
-        for dynamic_obstacle in scenario.dynamic_obstacles:
-            if dynamic_obstacle.state_at_time(time_step) is not None:
-                number_of_vehicles_at_time_step[time_step] += 1
+    # Each dynamic obstacle is present in the scenario for a continuous range of time steps.
+    # Instead of checking each obstacle at each time step, only the start and end of those ranges
+    # are recorded, and the number of vehicles at each time step is derived from them.
+    # The ranges follow the semantic of `DynamicObstacle.state_at_time`.
+    range_starts: List[int] = []
+    range_ends: List[int] = []
+    for dynamic_obstacle in scenario.dynamic_obstacles:
+        initial_time_step = dynamic_obstacle.initial_state.time_step
+        range_starts.append(initial_time_step)
+        range_ends.append(initial_time_step + 1)
+        if isinstance(dynamic_obstacle.prediction, TrajectoryPrediction):
+            trajectory = dynamic_obstacle.prediction.trajectory
+            range_starts.append(max(trajectory.initial_time_step, initial_time_step + 1))
+            range_ends.append(trajectory.initial_time_step + len(trajectory.state_list))
+
+    range_starts_array = np.clip(np.array(range_starts, dtype=np.int64), 0, max_time_step)
+    range_ends_array = np.clip(np.array(range_ends, dtype=np.int64), 0, max_time_step)
+    is_valid_range = range_starts_array < range_ends_array
+    change_of_number_of_vehicles = np.zeros(max_time_step + 1, dtype=np.int64)
+    np.add.at(change_of_number_of_vehicles, range_starts_array[is_valid_range], 1)
+    np.add.at(change_of_number_of_vehicles, range_ends_array[is_valid_range], -1)
+    number_of_vehicles_at_time_step = np.cumsum(change_of_number_of_vehicles)[:-1]
 
     traffic_density_over_time = (
-        np.array(number_of_vehicles_at_time_step)
-        / _lanelet_network_length(scenario)
-        / frame_factor
-        * 1000
+        number_of_vehicles_at_time_step / _lanelet_network_length(scenario) / frame_factor * 1000
     )  # [1 / km]
     time_correction = max_time_step / len(
         traffic_density_over_time
@@ -180,8 +197,16 @@ def _compute_traffic_density(scenario: Scenario, frame_factor: float) -> Tuple[f
 
 
 def _lanelet_network_length(scenario: Scenario) -> float:
-    return sum([_lanelet_length(lanelet) for lanelet in scenario.lanelet_network.lanelets])
+    lanelets = scenario.lanelet_network.lanelets
+    if len(lanelets) == 0:
+        return 0.0
 
+    center_vertices = np.concatenate([lanelet.center_vertices for lanelet in lanelets])
+    segments = np.diff(center_vertices, axis=0)
+    segment_lengths = np.hypot(segments[:, 0], segments[:, 1])
+    # The segments between the last vertex of a lanelet and the first vertex of the next lanelet
+    # are not part of the lanelet network and must not be counted.
+    last_vertex_indices = np.cumsum([len(lanelet.center_vertices) for lanelet in lanelets]) - 1
+    segment_lengths[last_vertex_indices[:-1]] = 0.0
 
-def _lanelet_length(lanelet: Lanelet) -> float:
-    return np.sum(np.linalg.norm(np.diff(lanelet.center_vertices, axis=0), axis=1))
+    return float(np.sum(segment_lengths))
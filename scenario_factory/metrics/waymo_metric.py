@@ -1,7 +1,5 @@
 import csv
 import logging
-import math
-import statistics
 from collections import defaultdict
 from dataclasses import dataclass, fields
 from pathlib import Path
@@ -11,7 +9,7 @@ import numpy as np
 from commonroad.prediction.prediction import TrajectoryPrediction
 from commonroad.scenario.obstacle import DynamicObstacle
 from commonroad.scenario.scenario import Scenario
-from commonroad.scenario.state import State, TraceState
+from commonroad.scenario.state import TraceState
 
 from scenario_factory.metrics.base import BaseMetric, combine_metrics
 from scenario_factory.utils import (
@@ -64,29 +62,10 @@ def write_waymo_metrics_to_csv(
 
     :returns: Nothing.
     """
-    formatted_data = []
-    for waymo_metric in combine_metrics(waymo_metric_collection):
-        formatted_data.append(
-            {
-                "scenario_id": str(waymo_metric.scenario_id),
-                "ade3": round(waymo_metric.ade3, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "ade5": round(waymo_metric.ade5, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "ade8": round(waymo_metric.ade8, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "fde3": round(waymo_metric.fde3, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "fde5": round(waymo_metric.fde5, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "fde8": round(waymo_metric.fde8, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "mr3": round(waymo_metric.mr3, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "mr5": round(waymo_metric.mr5, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "mr8": round(waymo_metric.mr8, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "rmse_mean": round(waymo_metric.rmse_mean, _DEFAULT_WAYMO_METRIC_PRECISION),
-                "rmse_stdev": round(waymo_metric.rmse_stdev, _DEFAULT_WAYMO_METRIC_PRECISION),
-            }
-        )
-
-    with open(csv_file_path, "w") as csv_file:
-        csv_writer = csv.DictWriter(
-            csv_file,
-            fieldnames=[
+    with open(csv_file_path, "w", newline="") as csv_file:
+        csv_writer = csv.writer(csv_file)
+        csv_writer.writerow(
+            [
                 "scenario_id",
                 "ade3",
                 "ade5",
@@ -99,10 +78,25 @@ def write_waymo_metrics_to_csv(
                 "mr8",
                 "rmse_mean",
                 "rmse_stdev",
-            ],
+            ]
         )
-        csv_writer.writeheader()
-        csv_writer.writerows(formatted_data)
+        for waymo_metric in combine_metrics(waymo_metric_collection):
+            csv_writer.writerow(
+                [
+                    str(waymo_metric.scenario_id),
+                    round(waymo_metric.ade3, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.ade5, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.ade8, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.fde3, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.fde5, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.fde8, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.mr3, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.mr5, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.mr8, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.rmse_mean, _DEFAULT_WAYMO_METRIC_PRECISION),
+                    round(waymo_metric.rmse_stdev, _DEFAULT_WAYMO_METRIC_PRECISION),
+                ]
+            )
 
 
 def compute_waymo_metric(scenario: Scenario, reference_scenario: Scenario) -> WaymoMetric:
@@ -127,6 +121,11 @@ def compute_waymo_metric(scenario: Scenario, reference_scenario: Scenario) -> Wa
             f"Cannot compute waymo metrics for scenario {scenario.scenario_id}: with reference scenario {reference_scenario.scenario_id}: The obstacles {dynamic_obstacle_ids_in_scenario.difference(dynamic_obstacle_ids_in_reference)} are in the scenario, but not in the reference scenario! This is usually the case, if you tried to compute wyamo metrics for a scenario after simulation but the simulation mode does not preserve obstacle IDs."
         )
     measurment_times = [3, 5, 8]
+    # The time steps of the measurment times only depend on the scenario, so they are computed once for all obstacles
+    measurment_time_steps = [
+        (measurment_time_in_sec, int(measurment_time_in_sec / scenario.dt))
+        for measurment_time_in_sec in measurment_times
+    ]
 
     average_displacement_errors: Dict[int, List[float]] = defaultdict(list)
     final_displacement_errors: Dict[int, List[float]] = defaultdict(list)
@@ -152,11 +151,14 @@ def compute_waymo_metric(scenario: Scenario, reference_scenario: Scenario) -> Wa
             )
 
         root_mean_squared_errors.append(_compute_root_mean_squared_error(displacement_vector))
-        for measurment_time_in_sec in measurment_times:
-            measurment_time_step = int(measurment_time_in_sec / scenario.dt)
+        # The average displacement errors for all measurment times can be derived from the
+        # cumulative displacement errors, so the displacement vector only needs to be summed once.
+        cumulative_displacement_errors = np.cumsum(displacement_vector)
+        miss_rate_thresholds = _get_waymo_miss_rate_thresholds_for_state(reference_start_state)
+        for measurment_time_in_sec, measurment_time_step in measurment_time_steps:
             average_displacement_errors[measurment_time_in_sec].append(
                 _compute_waymo_average_displacement_error_until_time_step(
-                    displacement_vector, measurment_time_step
+                    cumulative_displacement_errors, measurment_time_step
                 )
             )
 
@@ -166,14 +168,11 @@ def compute_waymo_metric(scenario: Scenario, reference_scenario: Scenario) -> Wa
                 )
             )
 
-            miss_rate_thresholds = _get_waymo_miss_rate_thresholds_for_state_and_time(
-                measurment_time_in_sec, reference_start_state
-            )
             miss_rates[measurment_time_in_sec].append(
                 _compute_waymo_miss_rate_until_time_step(
                     dynamic_obstacle,
                     dynamic_obstacle_ref,
-                    miss_rate_thresholds,
+                    miss_rate_thresholds[measurment_time_in_sec],
                     measurment_time_step,
                 )
             )
@@ -188,8 +187,20 @@ def compute_waymo_metric(scenario: Scenario, reference_scenario: Scenario) -> Wa
         final_displacement_errors
     )
     filtered_miss_rates = _filter_and_combine_waymo_metrics(miss_rates)
-    filtered_root_mean_squared_errors = list(
-        filter(lambda value: not math.isnan(value), root_mean_squared_errors)
+    root_mean_squared_errors_array = np.array(root_mean_squared_errors, dtype=np.float64)
+    filtered_root_mean_squared_errors = root_mean_squared_errors_array[
+        ~np.isnan(root_mean_squared_errors_array)
+    ]
+    # The standard deviation is only defined for at least two values
+    rmse_mean = (
+        float(np.mean(filtered_root_mean_squared_errors))
+        if len(filtered_root_mean_squared_errors) > 0
+        else float("nan")
+    )
+    rmse_stdev = (
+        float(np.std(filtered_root_mean_squared_errors, ddof=1))
+        if len(filtered_root_mean_squared_errors) > 1
+        else float("nan")
     )
 
     return WaymoMetric(
@@ -203,8 +214,8 @@ def compute_waymo_metric(scenario: Scenario, reference_scenario: Scenario) -> Wa
         mr3=filtered_miss_rates[3],
         mr5=filtered_miss_rates[5],
         mr8=filtered_miss_rates[8],
-        rmse_mean=statistics.mean(filtered_root_mean_squared_errors),
-        rmse_stdev=statistics.stdev(filtered_root_mean_squared_errors),
+        rmse_mean=rmse_mean,
+        rmse_stdev=rmse_stdev,
     )
 
 
@@ -217,11 +228,12 @@ def _filter_and_combine_waymo_metrics(metrics: Dict[int, List[float]]) -> Dict[i
     """
     filtered_metrics = {}
     for measurment_time, values in metrics.items():
-        filtered_values = list(filter(lambda value: not math.isnan(value), values))
+        values_array = np.fromiter(values, dtype=np.float64, count=len(values))
+        filtered_values = values_array[~np.isnan(values_array)]
         if len(filtered_values) == 0:
             filtered_metrics[measurment_time] = float("nan")
         else:
-            filtered_metrics[measurment_time] = statistics.mean(filtered_values)
+            filtered_metrics[measurment_time] = float(np.mean(filtered_values))
 
     return filtered_metrics
 
@@ -258,7 +270,8 @@ def compute_displacment_vector_between_two_dynamic_obstacles(
         )
         return None
 
-    displacement_errors = []
+    positions = []
+    reference_positions = []
     for time_step in range(
         dynamic_obstacle.prediction.initial_time_step,
         dynamic_obstacle.prediction.final_time_step,
@@ -277,21 +290,26 @@ def compute_displacment_vector_between_two_dynamic_obstacles(
         if not is_state_with_position(reference_state):
             raise RuntimeError()
 
-        displacement_error = np.linalg.norm(state.position - reference_state.position)
-        displacement_errors.append(displacement_error)
+        positions.append(state.position)
+        reference_positions.append(reference_state.position)
 
-    if len(displacement_errors) < 1:
+    if len(positions) < 1:
         return None
 
-    return np.array(displacement_errors)
+    displacements = np.array(positions) - np.array(reference_positions)
+    return np.hypot(displacements[:, 0], displacements[:, 1])
 
 
 def _compute_waymo_average_displacement_error_until_time_step(
-    displacement_vector: np.ndarray, time_step: int
+    cumulative_displacement_errors: np.ndarray, time_step: int
 ) -> float:
-    if len(displacement_vector) <= time_step:
+    """
+    :param cumulative_displacement_errors: The cumulative sum of the displacement vector.
+    :param time_step: The time step until which the displacement errors should be averaged.
+    """
+    if len(cumulative_displacement_errors) <= time_step:
         return float("nan")
-    return float(np.mean(displacement_vector[: time_step + 1]))
+    return float(cumulative_displacement_errors[time_step] / (time_step + 1))
 
 
 def _compute_waymo_minimum_final_displacement_error_at_time_step(
@@ -320,15 +338,18 @@ def _scale_velocity_for_miss_rate_threshold(velocity: float) -> float:
 _MISS_RATE_BASE_THRESHOLDS = {3: (2, 1), 5: (3.6, 1.8), 8: (6, 3)}
 
 
-def _get_waymo_miss_rate_thresholds_for_state_and_time(
-    time_in_sec: int, state: TraceState
-) -> Tuple[float, float]:
-    base_thresholds = _MISS_RATE_BASE_THRESHOLDS.get(time_in_sec)
-    if base_thresholds is None:
-        raise ValueError()
+def _get_waymo_miss_rate_thresholds_for_state(state: TraceState) -> Dict[int, Tuple[float, float]]:
+    """
+    Compute the miss rate thresholds for all measurment times at once, so that the velocity of `state` is only scaled once.
 
+    :param state: The reference state, usually the start state of the reference obstacle.
+    :returns: The scaled thresholds, indexed by their measurment time.
+    """
     scaled_velocity = _scale_velocity_for_miss_rate_threshold(state.velocity)
-    return (base_thresholds[0] * scaled_velocity, base_thresholds[1] * scaled_velocity)
+    return {
+        time_in_sec: (base_thresholds[0] * scaled_velocity, base_thresholds[1] * scaled_velocity)
+        for time_in_sec, base_thresholds in _MISS_RATE_BASE_THRESHOLDS.items()
+    }
 
 
 def _compute_waymo_miss_rate_until_time_step(
@@ -359,35 +380,45 @@ def _compute_waymo_miss_rate_until_time_step(
     if min_prediction_length < time_step:
         return float("nan")
 
-    misses = 0
-    for time_step in range(
+    evaluated_time_steps = range(
         dynamic_obstacle.prediction.initial_time_step, dynamic_obstacle.prediction.final_time_step
-    ):
-        state = dynamic_obstacle.state_at_time(time_step)
+    )
+    if len(evaluated_time_steps) == 0:
+        return float("nan")
+
+    positions = []
+    reference_positions = []
+    reference_orientations = []
+    for ts in evaluated_time_steps:
+        state = dynamic_obstacle.state_at_time(ts)
         if state is None:
             raise RuntimeError()
-        reference_state = dynamic_obstacle_reference.state_at_time(time_step)
+        reference_state = dynamic_obstacle_reference.state_at_time(ts)
         if reference_state is None:
             continue
-        if _is_state_miss(state, reference_state, thresholds[0], thresholds[1]):
-            misses += 1
-
-    return misses / time_step
+        positions.append(state.position)
+        reference_positions.append(reference_state.position)
+        reference_orientations.append(reference_state.orientation)
 
+    misses = 0
+    if len(positions) > 0:
+        # Project the displacements onto the longitudinal and lateral axis of the reference states
+        cartesian_vectors = np.array(positions) - np.array(reference_positions)
+        orientations_ref = np.array(reference_orientations)
+        cos_orientations_ref = np.cos(orientations_ref)
+        sin_orientations_ref = np.sin(orientations_ref)
+        dist_lon = (
+            cartesian_vectors[:, 0] * cos_orientations_ref
+            + cartesian_vectors[:, 1] * sin_orientations_ref
+        )
+        dist_lat = (
+            -cartesian_vectors[:, 0] * sin_orientations_ref
+            + cartesian_vectors[:, 1] * cos_orientations_ref
+        )
+        misses = int(
+            np.count_nonzero(
+                (np.abs(dist_lon) > thresholds[0]) | (np.abs(dist_lat) > thresholds[1])
+            )
+        )
 
-def _is_state_miss(
-    state: State, state_ref: State, threshold_lon_scaled: float, threshold_lat_scaled: float
-) -> bool:
-    """
-    Check if the state is a miss.
-    """
-    orientation_ref = state_ref.orientation
-    cartesian_vector = state.position - state_ref.position
-    dist_lon = cartesian_vector[0] * np.cos(orientation_ref) + cartesian_vector[1] * np.sin(
-        orientation_ref
-    )
-    dist_lat = -cartesian_vector[0] * np.sin(orientation_ref) + cartesian_vector[1] * np.cos(
-        orientation_ref
-    )
-
-    return abs(dist_lon) > threshold_lon_scaled or abs(dist_lat) > threshold_lat_scaled
+    return misses / len(evaluated_time_steps)
@@ -3,6 +3,7 @@ import collections.abc
 import logging
 import random
 import signal
+import threading
 import time
 import traceback
 import warnings
@@ -112,6 +113,9 @@ class PipelineExecutor:
         # Keep track of how many steps are currently being executed in the pipeline.
         # This number is used to determine whether the execution was finished.
         self._num_of_running_pipeline_steps = 0
+        # Set whenever a pipeline step finished, so that the main loop can react immediately
+        # instead of polling the state of the executor in fixed intervals.
+        self._pipeline_step_finished = threading.Event()
 
         self._pipeline_step_results: List[PipelineStepResult] = []
 
@@ -192,6 +196,15 @@ class PipelineExecutor:
         """
         Handles the result of a pipeline step execution and executes the consecutive pipeline step, if applicable.
         """
+        try:
+            self._handle_result_of_previous_step(future)
+        finally:
+            # Always wake up the main loop, because the number of running steps has changed.
+            self._pipeline_step_finished.set()
+
+    def _handle_result_of_previous_step(
+        self, future: Future[Tuple[int, PipelineStepResult]]
+    ) -> None:
         # If this method is called, this means that a previous task has finished executing
         self._num_of_running_pipeline_steps -= 1
 
@@ -309,7 +322,10 @@ class PipelineExecutor:
                 while self._num_of_running_pipeline_steps > 0:
                     if self._all_steps_ready_for_fold():
                         self._perform_fold_on_all_queued_values()
-                    time.sleep(1)
+                        continue
+                    # The timeout is only a fallback, normally the event is set as soon as a step finished.
+                    self._pipeline_step_finished.wait(timeout=1)
+                    self._pipeline_step_finished.clear()
         except KeyboardInterrupt:
             _LOGGER.info("Received shutdown signal, terminating all remaining tasks...")
         finally:
@@ -119,7 +119,7 @@ def pipeline_compute_single_scenario_metrics(
     Example: Compute metrics with frame factor adjustments
 
         def get_frame_factors(scenario: Scenario) -> float:
-            scenario_id = str(scenario.scenario_id).split("-")[-3]
+            scenario_id = f"{scenario.scenario_id.country_id}_{scenario.scenario_id.map_name}"
             match scenario_id:
                 case "DEU_Example":
                     return 0.78
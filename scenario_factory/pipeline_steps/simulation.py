@@ -24,6 +24,8 @@ def pipeline_simulate_scenario_with_sumo(
 ) -> ScenarioContainer:
     """
     Convert a CommonRoad Scenario to SUMO, generate random traffic on the network and simulate the traffic in SUMO.
+
+    Runs on a process pool, because libsumo can only run one simulation per process.
     """
     commonroad_scenario = scenario_container.scenario
     output_folder = ctx.get_temporary_folder("sumo_simulation_intermediates")
@@ -172,7 +172,12 @@ class ScenarioContainer:
         :returns: A new `ScenarioContainer` object, with attachments from the old `ScenarioContainer` and kwargs.
         """
         new_scenario_container = ScenarioContainer(new_scenario)
-        for attachment in self._attachments.values():
+        # Attachments that are overriden by kwargs would be discarded right away,
+        # so they are skipped instead of copying them first (e.g. a reference scenario can be quite large).
+        overriden_attachment_types = {type(value) for value in kwargs.values() if value is not None}
+        for attachment_type, attachment in self._attachments.items():
+            if attachment_type in overriden_attachment_types:
+                continue
             attachment_copy = copy.deepcopy(attachment)
             new_scenario_container.add_attachment(attachment_copy)
         return new_scenario_container.with_attachments(**kwargs)
@@ -293,7 +298,9 @@ def write_criticality_metrics_of_scenario_containers_to_csv(
 
     :returns: Nothing
     """
-    formatted_data = []
+    # The header must contain all measurments, so they must be known before the first row can be written.
+    # Therefore, only the criticality data is collected here, and the rows are written directly afterwards.
+    criticality_data_of_scenarios = []
     all_measurments = set()
     for scenario_container in scenario_containers:
         criticality_data = scenario_container.get_attachment(CriticalityMetrics)
@@ -303,24 +310,20 @@ def write_criticality_metrics_of_scenario_containers_to_csv(
             )
 
         all_measurments.update(criticality_data.get_metric_names())
-
-        for time_step, measurment in criticality_data.measurments_per_time_step():
-            row = {
-                "scenarioId": str(scenario_container.scenario.scenario_id),
-                "timeStep": time_step,
-            }
-            metrics = {}
-            for metric, value in measurment.items():
-                metrics[metric] = value
-            row.update(metrics)
-            formatted_data.append(row)
+        criticality_data_of_scenarios.append(
+            (str(scenario_container.scenario.scenario_id), criticality_data)
+        )
 
     measurment_fields = sorted(list(all_measurments))
     fieldnames = ["scenarioId", "timeStep"] + measurment_fields
-    with csv_file_path.open(mode="w") as csv_file:
+    with csv_file_path.open(mode="w", newline="") as csv_file:
         csv_writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
         csv_writer.writeheader()
-        csv_writer.writerows(formatted_data)
+        for scenario_id, criticality_data in criticality_data_of_scenarios:
+            for time_step, measurment in criticality_data.measurments_per_time_step():
+                csv_writer.writerow(
+                    {"scenarioId": scenario_id, "timeStep": time_step, **measurment}
+                )
 
 
 def write_general_scenario_metrics_of_scenario_containers_to_csv(
@@ -4,9 +4,7 @@ __all__ = [
 ]
 
 
-import copy
 import logging
-import math
 from typing import List, Set, Tuple
 
 import numpy as np
@@ -29,6 +27,7 @@ from scenario_factory.utils import (
     align_dynamic_obstacle_to_time_step,
     align_scenario_to_time_step,
     copy_scenario,
+    copy_state,
     create_planning_problem_solution_for_ego_vehicle,
     crop_dynamic_obstacle_to_time_frame,
     find_most_likely_lanelet_by_state,
@@ -56,11 +55,19 @@ def _select_obstacles_in_sensor_range_of_ego_vehicle(
 
     assert isinstance(ego_vehicle.prediction, TrajectoryPrediction)
 
-    for ego_vehicle_state in ego_vehicle.prediction.trajectory.state_list:
-        # Copy the position, because otherwise this would modify the resulting trajectory of the ego vehicle
-        proj_pos = copy.deepcopy(ego_vehicle_state.position)
-        proj_pos[0] += math.cos(ego_vehicle_state.orientation) + 2.0 * ego_vehicle_state.velocity
-        proj_pos[1] += math.sin(ego_vehicle_state.orientation) + 2.0 * ego_vehicle_state.velocity
+    ego_vehicle_states = ego_vehicle.prediction.trajectory.state_list
+    # Project the positions of the ego vehicle for the whole trajectory at once.
+    # This creates a new array, so the trajectory of the ego vehicle is not modified.
+    ego_vehicle_positions = np.array([state.position for state in ego_vehicle_states])
+    ego_vehicle_orientations = np.array([state.orientation for state in ego_vehicle_states])
+    ego_vehicle_velocities = np.array([state.velocity for state in ego_vehicle_states])
+    projected_positions = (
+        ego_vehicle_positions
+        + np.stack([np.cos(ego_vehicle_orientations), np.sin(ego_vehicle_orientations)], axis=1)
+        + 2.0 * ego_vehicle_velocities[:, None]
+    )
+
+    for ego_vehicle_state, proj_pos in zip(ego_vehicle_states, projected_positions):
         for obstacle in obstacles:
             if obstacle.obstacle_id == ego_vehicle.obstacle_id:
                 continue
@@ -83,7 +90,7 @@ def _select_obstacles_in_sensor_range_of_ego_vehicle(
 def _create_planning_problem_initial_state_for_ego_vehicle(
     ego_vehicle: DynamicObstacle,
 ) -> InitialState:
-    initial_state = copy.deepcopy(ego_vehicle.initial_state)
+    initial_state = copy_state(ego_vehicle.initial_state)
     initial_state.yaw_rate = 0.0
     initial_state.slip_angle = 0.0
     return initial_state
@@ -95,7 +102,7 @@ def _create_planning_problem_goal_state_for_ego_vehicle(
     """
     Create a new state that can be used as a goal state in a planning problem
     """
-    final_state_of_ego_vehicle = copy.deepcopy(ego_vehicle.prediction.trajectory.final_state)
+    final_state_of_ego_vehicle = copy_state(ego_vehicle.prediction.trajectory.final_state)
     goal_state = PMState(
         time_step=goal_time_interval,
         position=Rectangle(
@@ -144,7 +144,11 @@ def simulate_commonroad_scenario_with_sumo(
 
     if simulation_mode_requires_warmup:
         original_scenario_length = get_scenario_final_time_step(new_scenario)
-        new_scenario = crop_scenario_to_time_frame(new_scenario, min_time_step=warmup_time_steps)
+        # The simulated scenario is discarded after cropping, so its lanelet network can be
+        # reused instead of copying it again.
+        new_scenario = crop_scenario_to_time_frame(
+            new_scenario, min_time_step=warmup_time_steps, copy_lanelet_network=False
+        )
         align_scenario_to_time_step(new_scenario, warmup_time_steps)
         _LOGGER.debug(
             "Cut %s time steps from scenario %s after simulation with SUMO in mode %s to account for warmup time. The scenario after simulation had %s time steps and now has %s time steps",
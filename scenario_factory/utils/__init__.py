@@ -2,6 +2,7 @@ __all__ = [
     # loggign
     "configure_root_logger",
     # types
+    "copy_state",
     "convert_state_to_state_type",
     "convert_state_to_state",
     "is_state_list_with_acceleration",
@@ -90,6 +91,7 @@ from .scenario import (
 from .types import (
     convert_state_to_state,
     convert_state_to_state_type,
+    copy_state,
     is_state_list_with_acceleration,
     is_state_list_with_orientation,
     is_state_list_with_position,
@@ -1,4 +1,5 @@
-import copy
+import bisect
+from operator import attrgetter
 from typing import (
     List,
     Optional,
@@ -13,7 +14,7 @@ from commonroad.scenario.state import (
 from commonroad.scenario.trajectory import Trajectory
 
 from scenario_factory.utils.scenario import copy_scenario
-from scenario_factory.utils.types import WithTimeStep, convert_state_to_state_type
+from scenario_factory.utils.types import WithTimeStep, convert_state_to_state_type, copy_state
 
 
 def crop_state_list_to_time_frame(
@@ -42,7 +43,7 @@ def crop_state_list_to_time_frame(
     if initial_state.time_step >= min_time_step:
         if max_time_step is None or final_state.time_step <= max_time_step:
             # The state list is already in the time frame
-            return copy.deepcopy(states)
+            return [copy_state(state) for state in states]
     if max_time_step is not None and initial_state.time_step > max_time_step:
         # The state list starts only after the max time step, so we cannot cut a trajectory from this
         return None
@@ -52,14 +53,12 @@ def crop_state_list_to_time_frame(
         return None
 
     max_time_step = final_state.time_step if max_time_step is None else max_time_step
-    new_state_list = copy.deepcopy(
-        list(
-            filter(
-                lambda state: state.time_step >= min_time_step and state.time_step <= max_time_step,
-                states,
-            )
-        )
-    )
+    # The states are ordered by their time step, so the bounds of the time frame can be located
+    # with a binary search. Only the states inside the time frame are then sliced and copied,
+    # instead of visiting every state of the (possibly very long) state list.
+    start_index = bisect.bisect_left(states, min_time_step, key=attrgetter("time_step"))
+    end_index = bisect.bisect_right(states, max_time_step, key=attrgetter("time_step"))
+    new_state_list = [copy_state(state) for state in states[start_index:end_index]]
 
     return new_state_list
 
@@ -126,12 +125,13 @@ def crop_dynamic_obstacle_to_time_frame(
     if original_obstacle.initial_state.time_step < min_time_step:
         # If the initial state is before the min time step, a new initial state is required.
         # This new initial state is at the start of the time frame aka. min_time_step
-        state_at_min_time_step = copy.deepcopy(original_obstacle.state_at_time(min_time_step))
+        state_at_min_time_step = original_obstacle.state_at_time(min_time_step)
         if state_at_min_time_step is None:
             return None
+        state_at_min_time_step = copy_state(state_at_min_time_step)
         new_initial_state = convert_state_to_state_type(state_at_min_time_step, InitialState)
     else:
-        new_initial_state = copy.deepcopy(original_obstacle.initial_state)
+        new_initial_state = copy_state(original_obstacle.initial_state)
 
     new_trajectory_prediction = None
     if original_obstacle.prediction is not None:
@@ -151,11 +151,13 @@ def crop_dynamic_obstacle_to_time_frame(
     new_initial_signal_state = None
     if original_obstacle.initial_signal_state is not None:
         if original_obstacle.initial_signal_state.time_step < min_time_step:
-            new_initial_signal_state = copy.deepcopy(
-                original_obstacle.signal_state_at_time_step(min_time_step)
+            signal_state_at_min_time_step = original_obstacle.signal_state_at_time_step(
+                min_time_step
             )
+            if signal_state_at_min_time_step is not None:
+                new_initial_signal_state = copy_state(signal_state_at_min_time_step)
         else:
-            new_initial_signal_state = copy.deepcopy(original_obstacle.initial_signal_state)
+            new_initial_signal_state = copy_state(original_obstacle.initial_signal_state)
 
     new_signal_series = None
     if original_obstacle.signal_series is not None:
@@ -180,18 +182,24 @@ def crop_scenario_to_time_frame(
     scenario: Scenario,
     min_time_step: int = 0,
     max_time_step: Optional[int] = None,
+    copy_lanelet_network: bool = True,
 ) -> Scenario:
     """
     Crops a scenario to include only objects within a specified time frame and crop objects such that they are also in the time frame.
-    The input `scenario` and all its objects are not modified.
+    The input `scenario` and all its objects are not modified, unless :param:`copy_lanelet_network` is False: Then the lanelet network of `scenario` is shared with the new scenario and the cropped obstacles are registered on it.
 
     :param scenario: The original scenario to crop.
     :param min_time_step: The minimum time step to retain.
     :param max_time_step: The maximum time step to retain.
+    :param copy_lanelet_network: If False, the lanelet network of `scenario` is shared with the new scenario instead of being copied. Only disable this, if `scenario` is discarded afterwards, because modifications to the lanelet network will affect both scenarios.
 
     :return: A new scenario within the time frame.
     """
-    new_scenario = copy_scenario(scenario, copy_dynamic_obstacles=False)
+    new_scenario = copy_scenario(
+        scenario, copy_lanelet_network=copy_lanelet_network, copy_dynamic_obstacles=False
+    )
+    if not copy_lanelet_network:
+        new_scenario.add_objects(scenario.lanelet_network)
 
     # TODO: Also cut static and environment obstacles
 
@@ -1,7 +1,6 @@
 import math
 from typing import Optional, Sequence, Type
 
-import numpy as np
 from commonroad.common.solution import (
     CostFunction,
     PlanningProblemSolution,
@@ -177,4 +176,4 @@ def calculate_deviation_between_states(state1: TraceState, state2: TraceState) -
     if not is_state_with_position(state2):
         raise ValueError()
 
-    return float(np.linalg.norm(state1.position - state2.position))
+    return math.dist(state1.position, state2.position)
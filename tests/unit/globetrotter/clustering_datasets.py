@@ -58,14 +58,14 @@ CLUSTERING_TEST_DATASET = Dataset(
         ClusteringTestCase(
             label="generic1",
             points=np.array([[0, 0], [2, 0], [0, 3], [60, 0], [63, 0], [61, 3]]),
-            expected_labels=np.array([1, 1, 1, 0, 0, 0]),
+            expected_labels=np.array([0, 0, 0, 1, 1, 1]),
         ),
         ClusteringTestCase(
             label="generic2",
             points=np.array(
                 [[0, 0], [2, 0], [0, 2], [60, 0], [62, 0], [60, 2], [60, 60], [62, 60], [60, 62]]
             ),
-            expected_labels=np.array([2, 2, 2, 1, 1, 1, 0, 0, 0]),
+            expected_labels=np.array([0, 0, 0, 1, 1, 1, 2, 2, 2]),
         ),
     ]
 )
@@ -0,0 +1,97 @@
+import numpy as np
+from commonroad.scenario.scenario import Scenario
+from commonroad.scenario.state import CustomState
+from commonroad.scenario.trajectory import Trajectory
+
+from scenario_factory.builder.scenario_builder import ScenarioBuilder
+from scenario_factory.metrics.general_scenario_metric import (
+    _compute_traffic_density,
+    _compute_velocity,
+    _lanelet_network_length,
+)
+
+
+class TestLaneletNetworkLength:
+    def test_is_zero_for_empty_lanelet_network(self):
+        scenario_builder = ScenarioBuilder()
+        scenario_builder.create_lanelet_network()
+        scenario = scenario_builder.build()
+
+        assert _lanelet_network_length(scenario) == 0.0
+
+    def test_does_not_count_gaps_between_lanelets(self):
+        scenario_builder = ScenarioBuilder()
+        lanelet_network_builder = scenario_builder.create_lanelet_network()
+        lanelet_network_builder.add_lanelet(start=(0.0, 0.0), end=(10.0, 0.0))
+        lanelet_network_builder.add_lanelet(start=(100.0, 0.0), end=(100.0, 20.0))
+        scenario = scenario_builder.build()
+
+        assert np.isclose(_lanelet_network_length(scenario), 30.0)
+
+
+def _create_trajectory(start_time_step: int, final_time_step: int, velocity: float) -> Trajectory:
+    state_list = [
+        CustomState(time_step=time_step, position=np.array([0.0, 0.0]), velocity=velocity)
+        for time_step in range(start_time_step, final_time_step + 1)
+    ]
+    return Trajectory(start_time_step, state_list)
+
+
+def _create_scenario_with_two_obstacles() -> Scenario:
+    scenario_builder = ScenarioBuilder()
+    lanelet_network_builder = scenario_builder.create_lanelet_network()
+    lanelet_network_builder.add_lanelet(start=(0.0, 0.0), end=(100.0, 0.0))
+    scenario_builder.create_dynamic_obstacle().set_trajectory(
+        _create_trajectory(start_time_step=1, final_time_step=10, velocity=10.0)
+    )
+    # The second obstacle is not present between its initial state and the start of its trajectory
+    scenario_builder.create_dynamic_obstacle().set_trajectory(
+        _create_trajectory(start_time_step=5, final_time_step=10, velocity=20.0)
+    )
+    return scenario_builder.build()
+
+
+class TestComputeVelocity:
+    def test_averages_velocities_per_time_step(self):
+        scenario = _create_scenario_with_two_obstacles()
+
+        velocity_mean, velocity_stdev = _compute_velocity(scenario)
+
+        # t=1..4: only the first obstacle with 10 m/s, t=5..10: both obstacles with 15 m/s on average
+        assert np.isclose(velocity_mean, 13.0)
+        assert np.isclose(velocity_stdev, np.sqrt(6.0))
+
+
+class TestComputeTrafficDensity:
+    def test_counts_obstacles_only_at_time_steps_with_states(self):
+        scenario = _create_scenario_with_two_obstacles()
+        expected_number_of_vehicles = np.array(
+            [
+                sum(
+                    dynamic_obstacle.state_at_time(time_step) is not None
+                    for dynamic_obstacle in scenario.dynamic_obstacles
+                )
+                for time_step in range(10)
+            ]
+        )
+
+        traffic_density_mean, traffic_density_stdev = _compute_traffic_density(
+            scenario, frame_factor=1.0
+        )
+
+        # The lanelet network is 100 m long, so each vehicle adds 10 vehicles/km
+        assert np.isclose(traffic_density_mean, np.mean(expected_number_of_vehicles) * 10)
+        assert np.isclose(traffic_density_stdev, np.std(expected_number_of_vehicles) * 10)
+        assert np.isclose(traffic_density_mean, 16.0)
+
+    def test_is_nan_for_scenario_without_obstacles(self):
+        scenario_builder = ScenarioBuilder()
+        scenario_builder.create_lanelet_network().add_lanelet(start=(0.0, 0.0), end=(100.0, 0.0))
+        scenario = scenario_builder.build()
+
+        traffic_density_mean, traffic_density_stdev = _compute_traffic_density(
+            scenario, frame_factor=1.0
+        )
+
+        assert np.isnan(traffic_density_mean)
+        assert np.isnan(traffic_density_stdev)
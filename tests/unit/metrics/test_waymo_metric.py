@@ -1,13 +1,16 @@
 import numpy as np
 import pytest
+from commonroad.scenario.state import CustomState
 
 from scenario_factory.builder.dynamic_obstacle_builder import DynamicObstacleBuilder
 from scenario_factory.builder.scenario_builder import ScenarioBuilder
 from scenario_factory.builder.trajectory_builder import TrajectoryBuilder
 from scenario_factory.metrics import compute_waymo_metric
 from scenario_factory.metrics.waymo_metric import (
+    _compute_waymo_miss_rate_until_time_step,
     compute_displacment_vector_between_two_dynamic_obstacles,
 )
+from tests.helpers.obstacle import create_test_obstacle_with_trajectory
 
 
 class TestComputeDisplacementVectorBetweenTwoDynamicObstacles:
@@ -128,6 +131,56 @@ class TestComputeDisplacementVectorBetweenTwoDynamicObstacles:
         assert np.allclose(displacement_vector, [1.0, 1.0, 1.0, 1.0])
 
 
+def _create_obstacle_on_straight_line(
+    obstacle_id: int, start_time_step: int, final_time_step: int, lateral_offset: float
+):
+    return create_test_obstacle_with_trajectory(
+        [
+            CustomState(
+                time_step=time_step,
+                position=np.array([float(time_step), lateral_offset]),
+                orientation=0.0,
+                velocity=10.0,
+            )
+            for time_step in range(start_time_step, final_time_step + 1)
+        ],
+        obstacle_id=obstacle_id,
+    )
+
+
+class TestComputeWaymoMissRateUntilTimeStep:
+    def test_is_relative_to_the_evaluated_time_steps(self):
+        # The prediction starts late, so the miss rate must not be diluted by the time steps before it
+        obstacle = _create_obstacle_on_straight_line(1, 10, 20, lateral_offset=0.0)
+        reference_obstacle = _create_obstacle_on_straight_line(1, 10, 20, lateral_offset=5.0)
+
+        miss_rate = _compute_waymo_miss_rate_until_time_step(
+            obstacle, reference_obstacle, (2.0, 1.0), 15
+        )
+
+        assert miss_rate == 1.0
+
+    def test_is_zero_if_obstacles_match(self):
+        obstacle = _create_obstacle_on_straight_line(1, 10, 20, lateral_offset=0.0)
+        reference_obstacle = _create_obstacle_on_straight_line(1, 10, 20, lateral_offset=0.5)
+
+        miss_rate = _compute_waymo_miss_rate_until_time_step(
+            obstacle, reference_obstacle, (2.0, 1.0), 15
+        )
+
+        assert miss_rate == 0.0
+
+    def test_is_nan_if_prediction_is_too_short(self):
+        obstacle = _create_obstacle_on_straight_line(1, 10, 20, lateral_offset=0.0)
+        reference_obstacle = _create_obstacle_on_straight_line(1, 10, 20, lateral_offset=0.0)
+
+        miss_rate = _compute_waymo_miss_rate_until_time_step(
+            obstacle, reference_obstacle, (2.0, 1.0), 30
+        )
+
+        assert np.isnan(miss_rate)
+
+
 class TestComputeWaymoMetric:
     def test_fails_if_reference_scenario_does_not_contain_any_obstacles(self):
         scenario_builder = ScenarioBuilder()
@@ -143,3 +196,26 @@ class TestComputeWaymoMetric:
         reference_scenario = ScenarioBuilder().build()
         with pytest.raises(RuntimeError):
             compute_waymo_metric(scenario, reference_scenario)
+
+    def test_rmse_stdev_is_nan_for_single_obstacle(self):
+        scenario_builder = ScenarioBuilder()
+        (
+            scenario_builder.create_dynamic_obstacle(1)
+            .create_trajectory()
+            .start(time_step=0, position=(0.0, 1.0))
+            .end(time_step=50, position=(50.0, 1.0))
+        )
+        reference_scenario_builder = ScenarioBuilder()
+        (
+            reference_scenario_builder.create_dynamic_obstacle(1)
+            .create_trajectory()
+            .start(time_step=0, position=(0.0, 0.0))
+            .end(time_step=50, position=(50.0, 0.0))
+        )
+
+        waymo_metric = compute_waymo_metric(
+            scenario_builder.build(), reference_scenario_builder.build()
+        )
+
+        assert not np.isnan(waymo_metric.rmse_mean)
+        assert np.isnan(waymo_metric.rmse_stdev)
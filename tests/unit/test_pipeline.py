@@ -3,6 +3,7 @@ from pathlib import Path
 import pytest
 
 from scenario_factory.pipeline import Pipeline, PipelineContext
+from scenario_factory.pipeline.pipeline_executor import PipelineExecutor
 from tests.helpers.pipeline import (
     pipeline_even_filter,
     pipeline_simple_fold,
@@ -54,3 +55,20 @@ class TestPipeline:
         assert (
             len(result_b.values) == 1 and result_b.values[0] == exp_out
         ), "Expected correct output"
+
+    def test_concurrent_execution_does_not_wait_for_polling_interval(self, mocker):
+        inputs = list(range(10))
+
+        executor = PipelineExecutor(
+            PipelineContext(Path(".")),
+            [pipeline_simple_map(), pipeline_even_filter(), pipeline_simple_fold()],
+            num_threads=2,
+        )
+        wait_spy = mocker.spy(executor._pipeline_step_finished, "wait")
+
+        results = executor.run(inputs)
+
+        assert all(result.error is None for result in results), "Expected 0 errors"
+        assert wait_spy.call_count > 0
+        # Each wait must have been ended by a finished step and not by its timeout
+        assert all(wait_spy.spy_return_list)
@@ -1,3 +1,4 @@
+import csv
 import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -5,11 +6,13 @@ from tempfile import TemporaryDirectory
 import pytest
 from commonroad.common.solution import Solution
 from commonroad.planning.planning_problem import PlanningProblemSet
-from commonroad.scenario.scenario import Scenario
+from commonroad.scenario.scenario import Scenario, ScenarioID
 
+from scenario_factory.metrics import CriticalityMetrics
 from scenario_factory.scenario_container import (
     ScenarioContainer,
     load_scenarios_from_folder,
+    write_criticality_metrics_of_scenario_containers_to_csv,
 )
 from tests.resources import ResourceType
 
@@ -29,6 +32,28 @@ class TestScenarioContainer:
         scenario_container.delete_attachment(PlanningProblemSet)
         assert not scenario_container.has_attachment(PlanningProblemSet)
 
+    def test_new_with_attachments_copies_attachments_to_new_scenario_container(self) -> None:
+        planning_problem_set = PlanningProblemSet()
+        scenario_container = ScenarioContainer(
+            Scenario(dt=0.1), planning_problem_set=planning_problem_set
+        )
+
+        new_scenario_container = scenario_container.new_with_attachments(Scenario(dt=0.1))
+        new_planning_problem_set = new_scenario_container.get_attachment(PlanningProblemSet)
+        assert new_planning_problem_set is not None
+        assert new_planning_problem_set is not planning_problem_set
+
+    def test_new_with_attachments_prefers_attachments_from_kwargs(self) -> None:
+        scenario_container = ScenarioContainer(
+            Scenario(dt=0.1), planning_problem_set=PlanningProblemSet()
+        )
+
+        new_planning_problem_set = PlanningProblemSet()
+        new_scenario_container = scenario_container.new_with_attachments(
+            Scenario(dt=0.1), planning_problem_set=new_planning_problem_set
+        )
+        assert new_scenario_container.get_attachment(PlanningProblemSet) is new_planning_problem_set
+
 
 class TestLoadScenariosFromFolder:
     def test_throws_file_not_found_error_if_source_folder_does_not_exist(self):
@@ -70,3 +95,39 @@ class TestLoadScenariosFromFolder:
             for scenario_container in scenario_containers
         )
         assert len(scenario_containers) == num_solutions
+
+
+class TestWriteCriticalityMetricsOfScenarioContainersToCsv:
+    def test_writes_one_row_per_time_step_with_all_metrics(self):
+        scenario_containers = [
+            ScenarioContainer(
+                Scenario(dt=0.1, scenario_id=ScenarioID(map_name="A")),
+                criticality_metric=CriticalityMetrics({0: {"ttc": 1.0}, 1: {"ttc": 2.0}}),
+            ),
+            ScenarioContainer(
+                Scenario(dt=0.1, scenario_id=ScenarioID(map_name="B")),
+                criticality_metric=CriticalityMetrics({0: {"thw": 3.0}}),
+            ),
+        ]
+        temp_dir = TemporaryDirectory()
+        csv_file_path = Path(temp_dir.name) / "criticality.csv"
+
+        write_criticality_metrics_of_scenario_containers_to_csv(scenario_containers, csv_file_path)
+
+        with csv_file_path.open(newline="") as csv_file:
+            rows = list(csv.reader(csv_file))
+        assert rows == [
+            ["scenarioId", "timeStep", "thw", "ttc"],
+            [str(scenario_containers[0].scenario.scenario_id), "0", "", "1.0"],
+            [str(scenario_containers[0].scenario.scenario_id), "1", "", "2.0"],
+            [str(scenario_containers[1].scenario.scenario_id), "0", "3.0", ""],
+        ]
+
+    def test_fails_if_scenario_container_has_no_criticality_metrics(self):
+        temp_dir = TemporaryDirectory()
+        csv_file_path = Path(temp_dir.name) / "criticality.csv"
+
+        with pytest.raises(ValueError):
+            write_criticality_metrics_of_scenario_containers_to_csv(
+                [ScenarioContainer(Scenario(dt=0.1))], csv_file_path
+            )
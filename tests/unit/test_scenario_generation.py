@@ -7,6 +7,7 @@ from scenario_factory.builder import LaneletNetworkBuilder
 from scenario_factory.builder.dynamic_obstacle_builder import DynamicObstacleBuilder
 from scenario_factory.builder.trajectory_builder import TrajectoryBuilder
 from scenario_factory.scenario_generation import (
+    _select_obstacles_in_sensor_range_of_ego_vehicle,
     create_planning_problem_for_ego_vehicle,
     create_planning_problem_set_and_solution_for_ego_vehicle,
     delete_colliding_obstacles_from_scenario,
@@ -39,6 +40,46 @@ class TestDeleteCollidingObstaclesFromScenario:
         assert len(scenario.dynamic_obstacles) == 0
 
 
+class TestSelectObstaclesInSensorRangeOfEgoVehicle:
+    @staticmethod
+    def _create_obstacle_at_position(obstacle_id: int, x: float):
+        return create_test_obstacle_with_trajectory(
+            [
+                ExtendedPMState(
+                    time_step=i,
+                    position=np.array([x, 0.0]),
+                    velocity=0.0,
+                    acceleration=0.0,
+                    orientation=0.0,
+                )
+                for i in range(0, 10)
+            ],
+            obstacle_id=obstacle_id,
+        )
+
+    def test_selects_only_obstacles_in_sensor_range(self):
+        ego_vehicle = self._create_obstacle_at_position(1, 0.0)
+        near_obstacle = self._create_obstacle_at_position(2, 5.0)
+        far_obstacle = self._create_obstacle_at_position(3, 100.0)
+
+        relevant_obstacles = _select_obstacles_in_sensor_range_of_ego_vehicle(
+            [ego_vehicle, near_obstacle, far_obstacle], ego_vehicle, sensor_range=10
+        )
+        assert relevant_obstacles == [near_obstacle]
+
+    def test_does_not_modify_trajectory_of_ego_vehicle(self):
+        ego_vehicle = self._create_obstacle_at_position(1, 0.0)
+        near_obstacle = self._create_obstacle_at_position(2, 5.0)
+
+        _select_obstacles_in_sensor_range_of_ego_vehicle(
+            [near_obstacle], ego_vehicle, sensor_range=10
+        )
+        assert all(
+            np.array_equal(state.position, np.array([0.0, 0.0]))
+            for state in ego_vehicle.prediction.trajectory.state_list
+        )
+
+
 class TestCreatePlanningPorlbmeForEgoVehicle:
     def test_does_not_assign_goal_region_to_lanelet_if_goal_and_initial_state_are_on_same_lanelet(
         self,
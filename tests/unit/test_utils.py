@@ -6,7 +6,7 @@ import pytest
 from commonroad.common.solution import Solution
 from commonroad.planning.planning_problem import PlanningProblemSet
 from commonroad.scenario.scenario import Scenario
-from commonroad.scenario.state import CustomState, ExtendedPMState, InitialState
+from commonroad.scenario.state import CustomState, ExtendedPMState, InitialState, SignalState
 from commonroad.scenario.traffic_light import (
     TrafficLight,
     TrafficLightCycle,
@@ -22,6 +22,10 @@ from scenario_factory.utils import (
     align_traffic_light_to_time_step,
     convert_state_to_state,
     copy_scenario,
+    copy_state,
+    crop_dynamic_obstacle_to_time_frame,
+    crop_scenario_to_time_frame,
+    crop_state_list_to_time_frame,
     determine_xml_file_type,
     get_full_state_list_of_obstacle,
     try_load_xml_file_as_commonroad_scenario,
@@ -164,6 +168,101 @@ class TestAlignTrafficLightToTimeStep:
             ), f"Original state {original_state} at time step {i + alignment_time_step} does not match aligned state {aligned_state} at time step {i}"
 
 
+class TestCropStateListToTimeFrame:
+    @pytest.mark.parametrize(
+        ["state_time_steps", "min_time_step", "max_time_step", "expected_time_steps"],
+        [
+            ([0, 1, 2, 3, 4], 0, None, [0, 1, 2, 3, 4]),
+            ([0, 1, 2, 3, 4], 1, 3, [1, 2, 3]),
+            ([5, 6, 7, 8], 0, 6, [5, 6]),
+            ([5, 6, 7, 8], 7, None, [7, 8]),
+            ([0, 2, 5, 7, 9], 3, 8, [5, 7]),
+        ],
+    )
+    def test_correctly_crops_state_list_to_time_frame(
+        self, state_time_steps, min_time_step, max_time_step, expected_time_steps
+    ) -> None:
+        state_list = [CustomState(time_step=time_step) for time_step in state_time_steps]
+        cropped_state_list = crop_state_list_to_time_frame(state_list, min_time_step, max_time_step)
+        assert cropped_state_list is not None
+        assert [state.time_step for state in cropped_state_list] == expected_time_steps
+
+    def test_returns_none_if_state_list_is_outside_of_time_frame(self) -> None:
+        state_list = [CustomState(time_step=time_step) for time_step in range(10, 20)]
+        assert crop_state_list_to_time_frame(state_list, 0, 5) is None
+        assert crop_state_list_to_time_frame(state_list, 25) is None
+
+    def test_does_not_share_states_with_input(self) -> None:
+        state_list = [CustomState(time_step=time_step) for time_step in range(10)]
+        cropped_state_list = crop_state_list_to_time_frame(state_list, 2, 5)
+        assert cropped_state_list is not None
+        assert all(
+            cropped_state is not state
+            for cropped_state in cropped_state_list
+            for state in state_list
+        )
+
+
+class TestCropDynamicObstacleToTimeFrame:
+    def test_crops_signal_states(self) -> None:
+        obstacle = create_test_obstacle_with_trajectory(
+            [
+                CustomState(
+                    time_step=time_step,
+                    position=np.array([float(time_step), 0.0]),
+                    velocity=1.0,
+                    orientation=0.0,
+                )
+                for time_step in range(20)
+            ]
+        )
+        obstacle.initial_signal_state = SignalState(time_step=0, indicator_left=True)
+        obstacle.signal_series = [
+            SignalState(time_step=time_step, indicator_left=True) for time_step in range(1, 20)
+        ]
+
+        cropped_obstacle = crop_dynamic_obstacle_to_time_frame(obstacle, 5, 10)
+
+        assert cropped_obstacle is not None
+        assert cropped_obstacle.initial_signal_state is not None
+        assert cropped_obstacle.initial_signal_state.time_step == 5
+        assert all(
+            cropped_obstacle.initial_signal_state is not signal_state
+            for signal_state in obstacle.signal_series
+        )
+        assert cropped_obstacle.signal_series is not None
+        assert [signal_state.time_step for signal_state in cropped_obstacle.signal_series] == list(
+            range(6, 11)
+        )
+        assert all(
+            cropped_signal_state is not signal_state
+            for cropped_signal_state in cropped_obstacle.signal_series
+            for signal_state in obstacle.signal_series
+        )
+        assert all(signal_state.indicator_left for signal_state in cropped_obstacle.signal_series)
+
+
+class TestCropScenarioToTimeFrame:
+    def test_copies_lanelet_network_by_default(self):
+        scenario_builder = ScenarioBuilder()
+        lanelet_network_builder = scenario_builder.create_lanelet_network()
+        lanelet_network_builder.add_lanelet(start=(0.0, 0.0), end=(10.0, 10.0))
+        scenario = scenario_builder.build()
+
+        new_scenario = crop_scenario_to_time_frame(scenario, 0, 10)
+        assert new_scenario.lanelet_network is not scenario.lanelet_network
+        assert len(new_scenario.lanelet_network.lanelets) == 1
+
+    def test_shares_lanelet_network_if_copy_is_disabled(self):
+        scenario_builder = ScenarioBuilder()
+        lanelet_network_builder = scenario_builder.create_lanelet_network()
+        lanelet_network_builder.add_lanelet(start=(0.0, 0.0), end=(10.0, 10.0))
+        scenario = scenario_builder.build()
+
+        new_scenario = crop_scenario_to_time_frame(scenario, 0, 10, copy_lanelet_network=False)
+        assert new_scenario.lanelet_network is scenario.lanelet_network
+
+
 class TestCopyScenario:
     def test_handles_empty_scenario(self):
         scenario_builder = ScenarioBuilder()
@@ -201,6 +300,30 @@ class TestConvertStateToState:
         assert "foo" in new_state.used_attributes
 
 
+class TestCopyState:
+    def test_copies_state_without_sharing_position(self):
+        state = InitialState(time_step=3, position=np.array([1.0, 2.0]), velocity=4.0)
+        new_state = copy_state(state)
+        assert new_state is not state
+        assert isinstance(new_state, InitialState)
+        assert new_state == state
+
+        new_state.position[0] = 10.0
+        assert state.position[0] == 1.0
+
+    def test_copies_custom_state_with_custom_attributes(self):
+        state = CustomState(time_step=1, position=np.array([0.0, 0.0]), foo="bar")
+        new_state = copy_state(state)
+        assert "foo" in new_state.used_attributes
+        assert new_state.position is not state.position
+
+    def test_copies_signal_state(self):
+        state = SignalState(time_step=2, indicator_left=True, braking_lights=False)
+        new_state = copy_state(state)
+        assert new_state is not state
+        assert new_state == state
+
+
 class TestGetFullStateListOfObstacle:
     def test_returns_only_initial_state_if_obstacle_has_no_prediction(self):
         initial_state = InitialState()